@@ -17,6 +17,7 @@
 
 import re
 import socket
+import time
 
 from napalm.base.helpers import textfsm_extractor
 from napalm.base.helpers import mac, ip
@@ -35,6 +36,94 @@ from napalm_ftos.utils import (
     prep_addr
 )
 
+# precompiled patterns
+_RE_IP4_ADDR = re.compile(r'^Internet address is ([0-9\.]+)(?:\/(\d+))?')
+_RE_IP6_IFACE = re.compile(r'^(\w+( \d+(\/\d+)?)?)\s+')
+_RE_IP6_ADDR = re.compile(r'^\s*([a-f0-9:]+)(?:\/(\d+))?')
+_RE_SNMP = re.compile(r'^\s*snmp-server (community|contact|location) (.+?)\s*$', re.MULTILINE)
+_RE_USER = re.compile(r'^\s*username (\S+).+(?:sha256-)?password \d+ (\S+)(?: privilege (\d+))?')
+_RE_ERROR = re.compile(r'% Error: (.+)')
+_RE_PING = re.compile(r'Success rate is [\d\.]+ percent \((\d+)\/(\d+)\).+ = (\d+)\/(\d+)\/(\d+)')
+_RE_PROBE = re.compile(r'([\d\.]+)\s*ms')
+
+# default number of seconds `show interfaces' output is shared between
+# getters, so a get_interfaces() directly followed by
+# get_interfaces_counters() only fetches it once. Off by default, counters
+# polled within the ttl would come back unchanged
+_INTERFACES_CACHE_TTL = 0
+
+# clock used to age cached command output, one that doesn't jump along with
+# the system time where available
+_now = getattr(time, 'monotonic', time.time)
+
+# fields in `show system stack-unit' and the facts they map to
+_SYSTEM_FACTS = {
+    'Up Time':       'uptime',
+    'Mfg By':        'vendor',
+    'Serial Number': 'serial_number',
+    'Product Name':  'model',
+}
+
+# values for BGP neighbor fields that are not implemented
+_BGP_NEIGHBOR_DEFAULTS = {
+    "local_as": -1,
+    "routing_table": u'',
+    "local_address_configured": False,
+    "multihop": False,
+    "multipath": False,
+    "remove_private_as": False,
+    "import_policy": u'',
+    "export_policy": u'',
+    "previous_connection_state": u'',
+    "last_event": u'',
+    "suppress_4byte_as": False,
+    "local_as_prepend": False,
+    "configured_holdtime": -1,
+    "configured_keepalive": -1,
+    "active_prefix_count": -1,
+    "received_prefix_count": -1,
+    "suppressed_prefix_count": -1,
+}
+
+# BGP neighbor fields that are cast to integers
+_BGP_INT_KEYS = (
+    'remote_as', 'local_port', 'remote_port', 'input_messages',
+    'output_messages', 'input_updates', 'output_updates',
+    'messages_queued_out', 'holdtime', 'keepalive',
+    'accepted_prefix_count', 'advertised_prefix_count',
+    'flap_count',
+)
+
+# interface header and statistics blocks in `show interfaces', whose lines
+# might end in \r\n
+_RE_IFACE_HEADER = re.compile(r'^\s*(.+) is \w+, line protocol is \w+', re.MULTILINE)
+_RE_IFACE_STATS = re.compile(
+    r'^(Input|Output) Statistics:\r?\n'
+    r'\s*\d+ packets, (\d+) bytes.*\r?\n'
+    # not every interface (e.g. Vlan) lists all counters, so don't let the
+    # Input block run on into the Output block
+    r'(?:(?:(?!Output Statistics:).*\r?\n)*?'
+    r'\s*(\d+) Multicasts, (\d+) Broadcasts, (\d+) Unicasts.*\r?\n'
+    r'(?:(?!Output Statistics:).*\r?\n)*?'
+    r'.*, (\d+) discarded)?',
+    re.MULTILINE,
+)
+_IFACE_STATS_KEYS = ('octets', 'mcast', 'bcast', 'unicast', 'dcard')
+
+# counters in `show interfaces' and their names in get_interfaces_counters
+_COUNTER_KEYS = (
+    ('rx_octets',  'rx_octets'),
+    ('rx_unicast', 'rx_unicast_packets'),
+    ('rx_mcast',   'rx_multicast_packets'),
+    ('rx_bcast',   'rx_broadcast_packets'),
+    ('rx_dcard',   'rx_discards'),
+    ('tx_octets',  'tx_octets'),
+    ('tx_unicast', 'tx_unicast_packets'),
+    ('tx_mcast',   'tx_multicast_packets'),
+    ('tx_bcast',   'tx_broadcast_packets'),
+    ('tx_dcard',   'tx_discards'),
+)
+
 
 class FTOSDriver(NetworkDriver):
     """NAPALM Dell Force10 FTOS Handler."""
@@ -51,6 +140,12 @@ class FTOSDriver(NetworkDriver):
             optional_args = {}
 
         self.netmiko_optional_args = netmiko_args(optional_args)
+        self.interfaces_cache_ttl = optional_args.get('interfaces_cache_ttl',
+                                                      _INTERFACES_CACHE_TTL)
+
+        # command output kept around so it's only transferred once, see
+        # _send_cached_command()
+        self._command_cache = {}
 
     def _send_command(self, command):
         try:
@@ -71,11 +166,30 @@ class FTOSDriver(NetworkDriver):
             'dell_force10',
             netmiko_optional_args=self.netmiko_optional_args,
         )
+        self._invalidate_cache()
 
     def close(self):
         """Close the connection to the device."""
+        self._invalidate_cache()
         self._netmiko_close()
 
+    def _send_cached_command(self, command, ttl):
+        """Send command, reusing its output if it was fetched less than ttl seconds ago."""
+        if command in self._command_cache:
+            timestamp, output = self._command_cache[command]
+            # without a monotonic clock, time might have been set back since
+            if 0 <= _now() - timestamp < ttl:
+                return output
+
+        output = self._send_command(command)
+        # stamp the output once it's complete, fetching it might take a while
+        self._command_cache[command] = (_now(), output)
+        return output
+
+    def _invalidate_cache(self):
+        """Drop command output cached for this connection."""
+        self._command_cache = {}
+
     def get_arp_table(self, vrf=u''):
         """FTOS implementation of get_arp_table."""
         if vrf:
@@ -86,12 +200,14 @@ class FTOSDriver(NetworkDriver):
         arp_entries = self._send_command(command)
         arp_entries = textfsm_extractor(self, 'show_arp', arp_entries)
 
+        _ip, _mac = ip, mac
+
         table = []
-        for idx, arp in enumerate(arp_entries):
+        for arp in arp_entries:
             entry = {
                 'interface': arp['interface'],
-                'ip': ip(arp['ip']),
-                'mac': mac(arp['mac']),
+                'ip': _ip(arp['ip']),
+                'mac': _mac(arp['mac']),
             }
 
             try:
@@ -115,50 +231,27 @@ class FTOSDriver(NetworkDriver):
         neighbors = textfsm_extractor(self, 'show_ip_bgp_neighbors', neighbors)
 
         table = {u'global': {}}
-        for idx, entry in enumerate(neighbors):
+        for entry in neighbors:
             # TODO: couldn't detect VRF from output
             vrf = u'global'
 
-            neighbor = {
+            neighbor = dict(_BGP_NEIGHBOR_DEFAULTS)
+            neighbor.update({
                 "up": (entry['connection_state'] == 'ESTABLISHED'),
-                "local_as": -1,  # unimplemented
                 "router_id": ip(entry['router_id']),
                 "local_address": py23_compat.text_type(entry['local_address']),
-                "routing_table": u'',  # unimplemented
-                "local_address_configured": False,  # unimplemented
-                "local_port": entry['local_port'],
                 "remote_address": ip(entry['remote_address']),
-                "multihop": False,  # unimplemented
-                "multipath": False,  # unimplemented
-                "remove_private_as": False,  # unimplemented
-                "import_policy": u'',  # unimplemented
-                "export_policy": u'',  # unimplemented
                 "connection_state": entry['connection_state'],
-                "previous_connection_state": u'',  # unimplemented
-                "last_event": u'',  # unimplemented
-                "suppress_4byte_as": False,  # unimplemented
-                "local_as_prepend": False,  # unimplemented
-                "configured_holdtime": -1,  # unimplemented
-                "configured_keepalive": -1,  # unimplemented
-                "active_prefix_count": -1,  # unimplemented
-                "received_prefix_count": -1,  # unimplemented
-                "suppressed_prefix_count": -1,  # unimplemented
-            }
+            })
 
             # cast some integers
-            for k in ['remote_as', 'local_port', 'remote_port', 'input_messages',
-                      'output_messages', 'input_updates', 'output_updates',
-                      'messages_queued_out', 'holdtime', 'keepalive',
-                      'accepted_prefix_count', 'advertised_prefix_count',
-                      'flap_count']:
+            for k in _BGP_INT_KEYS:
                 try:
                     neighbor[k] = int(entry[k])
                 except ValueError:
                     neighbor[k] = -1
 
-            if entry['remote_as'] not in table[vrf]:
-                table[vrf][int(entry['remote_as'])] = []
-            table[vrf][int(entry['remote_as'])].append(neighbor)
+            table[vrf].setdefault(neighbor['remote_as'], []).append(neighbor)
 
         return table
 
@@ -197,7 +290,7 @@ class FTOSDriver(NetworkDriver):
         # get sensor data
         environment = self._send_command("show environment stack-unit")
         environment = textfsm_extractor(self, 'show_environment_stack-unit', environment)
-        for idx, entry in enumerate(environment):
+        for entry in environment:
             name = "Unit %d" % int(entry['unit'])
             # temperature
             env['temperature'][name] = {
@@ -215,7 +308,7 @@ class FTOSDriver(NetworkDriver):
         # get CPU data
         processes = self._send_command("show processes cpu summary")
         processes = textfsm_extractor(self, 'show_processes_cpu_summary', processes)
-        for idx, entry in enumerate(processes):
+        for entry in processes:
             env['cpu']["Unit %d" % int(entry['unit'])] = {
                 '%usage': float(entry['omin']),
             }
@@ -223,9 +316,8 @@ class FTOSDriver(NetworkDriver):
         # get memory data
         memory = self._send_command("show memory")
         memory = textfsm_extractor(self, "show_memory", memory)
-        for idx, entry in enumerate(memory):
-            env['memory']['available_ram'] += int(entry['total'])
-            env['memory']['used_ram'] += int(entry['used'])
+        env['memory']['available_ram'] = sum(int(entry['total']) for entry in memory)
+        env['memory']['used_ram'] = sum(int(entry['used']) for entry in memory)
 
         return env
 
@@ -247,28 +339,32 @@ class FTOSDriver(NetworkDriver):
 
         # parse version output
         for line in show_ver.splitlines():
-            if line.startswith('Up Time'):
-                uptime_str = line.split(': ')[1]
-                facts['uptime'] = parse_uptime(uptime_str)
-            elif line.startswith('Mfg By'):
-                facts['vendor'] = line.split(': ')[1].strip()
-            elif ' OS Version' in line:
-                facts['os_version'] = line.split(': ')[1].strip()
-            elif line.startswith('Serial Number'):
-                facts['serial_number'] = line.split(': ')[1].strip()
-            elif line.startswith('Product Name'):
-                facts['model'] = line.split(': ')[1].strip()
+            key, _, value = line.partition(': ')
+            field = _SYSTEM_FACTS.get(key.rstrip())
+            if field == 'uptime':
+                facts['uptime'] = parse_uptime(value)
+            elif field:
+                facts[field] = value.strip()
+            # the OS name in front of the version varies between releases
+            elif ' OS Version' in key:
+                facts['os_version'] = value.strip()
 
         # invoke get_interfaces and list interfaces
-        facts['interface_list'] = sorted(self.get_interfaces().keys())
+        facts['interface_list'] = sorted(self.get_interfaces())
 
         # get hostname from running config
         config = self.get_config('running')['running']
-        for line in config.splitlines():
-            if line.startswith('hostname '):
-                facts['hostname'] = re.sub('^hostname ', '', line)
-                facts['fqdn'] = facts['hostname']
-                break
+        # look the line up in the unsplit config, which could be huge
+        if config.startswith('hostname '):
+            start = 9
+        else:
+            start = config.find('\nhostname ')
+            if start >= 0:
+                start += 10
+        if start >= 0:
+            end = config.find('\n', start)
+            facts['hostname'] = config[start:end if end >= 0 else None].strip()
+            facts['fqdn'] = facts['hostname']
 
         return facts
 
@@ -298,33 +394,30 @@ class FTOSDriver(NetworkDriver):
         lldp_entries = self._send_command(command)
         lldp_entries = textfsm_extractor(self, 'show_lldp_neighbors_detail', lldp_entries)
 
+        _mac, _iface_name = mac, canonical_interface_name
+        _capab = transform_lldp_capab
+
         lldp = {}
-        for idx, lldp_entry in enumerate(lldp_entries):
+        for lldp_entry in lldp_entries:
             # TODO: the current textfsm template keeps adding an empty entry at
             # the end of each interface and I couldn't fix it so at some point
             # it was just easier to get rid of these empty entries in code
-            nonZero = False
-            for key in lldp_entry.keys():
-                # local_interface is set to Filldown so that is always filled
-                if key == 'local_interface':
-                    continue
-                if len(lldp_entry[key].strip()) > 0:
-                    nonZero = True
-                    break
-            if not nonZero:
+            # local_interface is set to Filldown so that is always filled
+            local_intf = lldp_entry.pop('local_interface')
+            if not any(value.strip() for value in lldp_entry.values()):
                 continue
 
             # get pretty interface name
-            local_intf = canonical_interface_name(lldp_entry.pop('local_interface'))
+            local_intf = _iface_name(local_intf)
 
             # cast some mac addresses
             for k in ['remote_port', 'remote_chassis_id']:
                 if len(lldp_entry[k].strip()) > 0:
-                    lldp_entry[k] = mac(lldp_entry[k])
+                    lldp_entry[k] = _mac(lldp_entry[k])
 
             # transform capabilities
             for k in ['remote_system_capab', 'remote_system_enable_capab']:
-                lldp_entry[k] = transform_lldp_capab(lldp_entry[k])
+                lldp_entry[k] = _capab(lldp_entry[k])
 
             # not implemented
             lldp_entry['parent_interface'] = u''
@@ -339,22 +432,23 @@ class FTOSDriver(NetworkDriver):
         mac_entries = self._send_command("show mac-address-table")
         mac_entries = textfsm_extractor(self, 'show_mac-address-table', mac_entries)
 
-        mac_table = []
-        for idx, entry in enumerate(mac_entries):
-            entry['mac'] = mac(entry['mac'])
-            entry['interface'] = canonical_interface_name(entry['interface'])
+        _mac, _iface_name = mac, canonical_interface_name
+
+        # entries are updated in place, so the parsed list is returned as is
+        # rather than copied into a second list
+        for entry in mac_entries:
+            entry['mac'] = _mac(entry['mac'])
+            entry['interface'] = _iface_name(entry['interface'])
             entry['vlan'] = int(entry['vlan'])
             entry['static'] = (entry['static'] == 'Static')
             entry['active'] = (entry['active'] == 'Active')
             entry['moves'] = -1        # not implemented
             entry['last_move'] = -1.0  # not implemented
 
-            mac_table.append(entry)
-
-        return mac_table
+        return mac_entries
 
     def _get_interfaces_detail(self):
-        iface_entries = self._send_command("show interfaces")
+        iface_entries = self._send_cached_command("show interfaces", self.interfaces_cache_ttl)
         return textfsm_extractor(self, 'show_interfaces', iface_entries)
 
     def get_interfaces(self):
@@ -362,7 +456,7 @@ class FTOSDriver(NetworkDriver):
         iface_entries = self._get_interfaces_detail()
 
         interfaces = {}
-        for i, entry in enumerate(iface_entries):
+        for entry in iface_entries:
             if len(entry['iface_name']) == 0:
                 continue
 
@@ -390,13 +484,13 @@ class FTOSDriver(NetworkDriver):
                 iface['is_up'] = True
 
             # parse line_speed
-            if re.search(r'bit$', entry['line_speed']):
-                speed = entry['line_speed'].split(' ')
-                if speed[1] == 'Mbit':
-                    iface['speed'] = int(speed[0])
+            if entry['line_speed'].endswith('bit'):
+                speed, _, unit = entry['line_speed'].rpartition(' ')
+                if unit == 'Mbit':
+                    iface['speed'] = int(speed)
                 # not sure if this ever occurs
-                elif speed[1] == 'Gbit':
-                    iface['speed'] = int(speed[0]*1000)
+                elif unit == 'Gbit':
+                    iface['speed'] = int(speed) * 1000
 
             # parse last_flapped
             iface['last_flapped'] = float(parse_uptime(entry['last_flapped'], True))
@@ -409,33 +503,32 @@ class FTOSDriver(NetworkDriver):
 
     def get_interfaces_counters(self):
         """FTOS implementation of get_interfaces_counters."""
-        iface_entries = self._get_interfaces_detail()
+        output = self._send_cached_command("show interfaces", self.interfaces_cache_ttl)
+
+        # only a handful of counters are needed from the output, so rather
+        # than running the full TextFSM template, cut the output into one
+        # block per interface and pick the statistics out of it
+        headers = list(_RE_IFACE_HEADER.finditer(output))
+        ends = [m.start() for m in headers[1:]] + [len(output)]
+
         interfaces = {}
-        key_map = [
-            ['rx_octets',  'rx_octets'],
-            ['rx_unicast', 'rx_unicast_packets'],
-            ['rx_mcast',   'rx_multicast_packets'],
-            ['rx_bcast',   'rx_broadcast_packets'],
-            ['rx_dcard',   'rx_discards'],
-            ['tx_octets',  'tx_octets'],
-            ['tx_unicast', 'tx_unicast_packets'],
-            ['tx_mcast',   'tx_multicast_packets'],
-            ['tx_bcast',   'tx_broadcast_packets'],
-            ['tx_dcard',   'tx_discards'],
-        ]
-        for idx, entry in enumerate(iface_entries):
+        for header, end in zip(headers, ends):
+            entry = {}
+            for m in _RE_IFACE_STATS.finditer(output, header.end(), end):
+                direction = 'rx' if m.group(1) == 'Input' else 'tx'
+                for key, value in zip(_IFACE_STATS_KEYS, m.groups()[1:]):
+                    if value is not None:
+                        entry['%s_%s' % (direction, key)] = value
+
             iface = {
                 'rx_errors': 0,  # unimplemented
                 'tx_errors': 0,  # unimplemented
             }
-            for key in key_map:
-                try:
-                    iface[key[1]] = int(entry[key[0]])
-                except ValueError:
-                    iface[key[1]] = 0
+            for src, dst in _COUNTER_KEYS:
+                iface[dst] = int(entry.get(src, 0))
 
             # add interface data to dict
-            local_intf = canonical_interface_name(entry['iface_name'])
+            local_intf = canonical_interface_name(header.group(1))
             interfaces[local_intf] = iface
 
         return interfaces
@@ -451,15 +544,16 @@ class FTOSDriver(NetworkDriver):
         # parse IP addresses
         iface = None
         for line in ip_res.splitlines():
-            # interface line
-            m = re.search(r'^(\w+( \d+(\/\d+)?)?) is \w+', line)
-            if m:
+            # interface line, e.g. `Vlan 10 is up, line protocol is up'
+            if ', line protocol is ' in line and not line[:1].isspace():
                 # capture interface name and move on to next line
-                iface = m.group(1)
+                iface = line.partition(' is ')[0]
                 continue
 
             # look for IPv4 address line
-            m = re.search(r'^Internet address is ([0-9\.]+)(?:\/(\d+))?', line)
+            if not line.startswith('Internet address is '):
+                continue
+            m = _RE_IP4_ADDR.match(line)
             if not m:
                 continue
 
@@ -486,15 +580,18 @@ class FTOSDriver(NetworkDriver):
         # parse IPv6 addresses
         iface = None
         for line in ip6_res.splitlines():
-            # interface line
-            m = re.search(r'^(\w+( \d+(\/\d+)?)?)\s+', line)
-            if m:
-                # capture interface name and move on to next line
-                iface = m.group(1)
+            # interface line, addresses are indented below it
+            if not line[:1].isspace():
+                m = _RE_IP6_IFACE.match(line)
+                if m:
+                    # capture interface name and move on to next line
+                    iface = m.group(1)
                 continue
 
             # look for IPv6 address line
-            m = re.search(r'^\s*([a-f0-9:]+)(?:\/(\d+))?', line)
+            if ':' not in line:
+                continue
+            m = _RE_IP6_ADDR.match(line)
             if not m:
                 continue
 
@@ -511,7 +608,7 @@ class FTOSDriver(NetworkDriver):
                 # remove prefix length from address
                 address = address.replace('/%d' % preflen, '')
             # for link-local addresses assume prefix length /64
-            elif re.search(r'^fe80', address):
+            elif address.startswith('fe80'):
                 preflen = 64
 
             addr[iface][u'ipv6'][address] = {
@@ -529,7 +626,7 @@ class FTOSDriver(NetworkDriver):
         entries = self._get_ntp_assoc()
 
         peers = {}
-        for idx, entry in enumerate(entries):
+        for entry in entries:
             peers[ip(entry['remote'])] = {}
 
         return peers
@@ -541,8 +638,10 @@ class FTOSDriver(NetworkDriver):
     def get_ntp_stats(self):
         """FTOS implementation of get_ntp_stats."""
         entries = self._get_ntp_assoc()
-        stats = []
-        for idx, entry in enumerate(entries):
+
+        # entries are updated in place, so the parsed list is returned as is
+        # rather than copied into a second list
+        for entry in entries:
             # cast ints
             for key in ['stratum', 'hostpoll', 'reachability']:
                 try:
@@ -561,9 +660,8 @@ class FTOSDriver(NetworkDriver):
                     entry[k] = ip(entry[k])
 
             entry['synchronized'] = (entry['type'] == '*')
-            stats.append(entry)
 
-        return stats
+        return entries
 
     def get_snmp_information(self):
         """FTOS implementation of get_snmp_information."""
@@ -577,24 +675,23 @@ class FTOSDriver(NetworkDriver):
             'location':   u'',
         }
 
-        for line in snmp.splitlines():
-            if 'community' in line:
-                m = re.search(r'^snmp-server community ([^\s]+) ([^\s]+)(?: ([^\s]+))?', line.strip())
-                if not m:
+        # a single scan over the whole output picks up all relevant statements
+        for m in _RE_SNMP.finditer(snmp):
+            keyword, value = m.groups()
+            if keyword == 'community':
+                fields = value.split()
+                if len(fields) < 2:
                     continue
                 com = {
-                    'mode': m.group(2),
+                    'mode': fields[1],
                     'acl':  u'N/A',
                 }
-                if m.group(3):
-                    com['acl'] = m.group(3)
+                if len(fields) > 2:
+                    com['acl'] = fields[2]
 
-                info['community'][m.group(1)] = com
-
-            elif 'location' in line:
-                info['location'] = line.strip().replace('snmp-server location ', '').strip('"')
-            elif 'contact' in line:
-                info['contact'] = line.strip().replace('snmp-server contact ', '').strip('"')
+                info['community'][fields[0]] = com
+            else:
+                info[keyword] = value.strip('"')
 
         return info
 
@@ -603,10 +700,9 @@ class FTOSDriver(NetworkDriver):
         command = "show running-config users"
         output = self._send_command(command)
 
-        ptr = re.compile(r'^username ([^\s]+).+(?:sha256-)?password \d+ ([^\s]+) (?:privilege (\d+))?')
         users = {}
         for line in output.splitlines():
-            m = ptr.search(line.strip())
+            m = _RE_USER.match(line)
             if not m:
                 continue
 
@@ -656,14 +752,14 @@ class FTOSDriver(NetworkDriver):
         result = self._send_command(command)
 
         # check if output holds an error
-        m = re.search(r'% Error: (.+)', result)
+        m = _RE_ERROR.search(result)
         if m:
             return {
                 'error': m.group(1)
             }
 
         # try to parse the output
-        m = re.search(r'Success rate is [\d\.]+ percent \((\d+)\/(\d+)\).+ = (\d+)\/(\d+)\/(\d+)', result)
+        m = _RE_PING.search(result)
         if not m:
             return {
                 'error': 'could not parse output',
@@ -699,7 +795,7 @@ class FTOSDriver(NetworkDriver):
         result = self._send_command(command)
 
         # check if output holds an error
-        m = re.search(r'% Error: (.+)', result)
+        m = _RE_ERROR.search(result)
         if m:
             return {
                 'error': m.group(1)
@@ -709,24 +805,25 @@ class FTOSDriver(NetworkDriver):
         result = textfsm_extractor(self, 'traceroute', result)
         trace = {}
         ttl = None
-        for idx, entry in enumerate(result):
+        for entry in result:
             if len(entry['ttl'].strip()) > 0 and ttl != int(entry['ttl']):
                 ttl = int(entry['ttl'])
                 trace[ttl] = {'probes': {}}
                 ctr = 1
 
-            # rewrite probes for easier splitting
-            probes = re.sub(r'\s+', ' ', entry['probes'].replace('ms', '').strip())
+            # pick the round trip times out of the probes
+            probes = _RE_PROBE.findall(entry['probes'])
             if len(probes) == 0:
-                probes = []
-            else:
-                probes = probes.split(' ')
+                continue
 
+            # all probes on this line went to the same hop
+            hop = py23_compat.text_type(entry['hop'])
+            hop_ip = ip(hop)
             for probe in probes:
                 trace[ttl]['probes'][ctr] = {
                     'rtt': float(probe),
-                    'ip_address': ip(py23_compat.text_type(entry['hop'])),
-                    'host_name': py23_compat.text_type(entry['hop']),
+                    'ip_address': hop_ip,
+                    'host_name': hop,
                 }
                 ctr += 1
 
@@ -11,10 +11,60 @@ DAY_SECONDS = 24 * HOUR_SECONDS
 WEEK_SECONDS = 7 * DAY_SECONDS
 YEAR_SECONDS = 365 * DAY_SECONDS
 
+# precompiled patterns
+_RE_GIG_IFACE = re.compile(r'^((?:Forty|Ten)GigabitEthernet)(\d+\/\d+)$')
+_RE_UPTIME_HMS = re.compile(r'^(\d+):(\d+):(\d+)$')
+_RE_UPTIME_LONG = re.compile(r'(\d+)\s+([ywdhm])')
+
+# seconds per unit, keyed on the first letter of the unit
+_UPTIME_UNITS = {
+    'y': YEAR_SECONDS,
+    'w': WEEK_SECONDS,
+    'd': DAY_SECONDS,
+    'h': HOUR_SECONDS,
+    'm': MINUTE_SECONDS,
+    's': 1,
+}
+
+# FTOS LLDP capabilities and their Napalm generic counterparts
+_LLDP_CAPAB_MODES = [
+    (re.compile(r'^%s\s*' % name, re.IGNORECASE), mode) for name, mode in [
+        ['Repeater', 'repeater'],
+        ['Bridge', 'bridge'],
+        ['WLAN Access Point', 'wlan-access-point'],
+        ['Router', 'router'],
+        ['Telephone', 'telephone'],
+        ['Docsis', 'docsis-cable-device'],
+        ['Station only', 'station'],
+        ['Other', 'other']
+    ]
+]
+
+
+# interface names repeat a lot across getters, so remember what they expand to
+_IFACE_NAME_CACHE = {}
+_IFACE_NAME_CACHE_SIZE = 4096
+
 
 # overload canonical_interface_name and apply some FTOS specifics
 def canonical_interface_name(iface):
     """Convert an interface's name into a fully expanded name with a little bit of FTOS sauce."""
+    try:
+        return _IFACE_NAME_CACHE[iface]
+    except KeyError:
+        pass
+
+    name = _canonical_interface_name(iface)
+
+    # keep the cache bounded, a device only has that many interfaces anyway
+    if len(_IFACE_NAME_CACHE) >= _IFACE_NAME_CACHE_SIZE:
+        _IFACE_NAME_CACHE.clear()
+    _IFACE_NAME_CACHE[iface] = name
+
+    return name
+
+
+def _canonical_interface_name(iface):
     # all interfaces in base.canonical_map.base_interfaces are capitalized
     # so to make sure we match those names, we capitalize the name before running
     # it against that map
@@ -27,9 +77,10 @@ def canonical_interface_name(iface):
     iface = can_iface_name(iface)
 
     # add whitespace in *GigabitEthernet names
-    m = re.search(r'^((?:Forty|Ten)GigabitEthernet)(\d+\/\d+)$', iface)
-    if m:
-        iface = ' '.join(m.groups())
+    if iface.startswith(('FortyGigabitEthernet', 'TenGigabitEthernet')):
+        m = _RE_GIG_IFACE.search(iface)
+        if m:
+            iface = ' '.join(m.groups())
 
     return iface
 
@@ -39,34 +90,22 @@ def _parse_uptime_short(uptime_str):
     # after a day, time is expressed as 1d22h23m or even 20w4d21h
     # perhaps even in years at some point
 
-    match = re.compile(r'^(\d+):(\d+):(\d+)$').search(uptime_str)
+    match = _RE_UPTIME_HMS.search(uptime_str)
     if match:
-        return (0, 0, 0, int(match.group(1)), int(match.group(2)), int(match.group(3)))
-
-    # Initialize to zero
-    (years, weeks, days, hours, minutes, seconds) = (0,) * 6
-
-    match = re.compile(r'(\d+w)?(\d+d)?(\d+h)?(\d+m)?').search(uptime_str)
-    for m in match.groups():
-        if m is None:
-            continue
-        # year
-        elif m.endswith('y'):
-            years = int(m[:-1])
-        # week
-        elif m.endswith('w'):
-            weeks = int(m[:-1])
-        # day
-        elif m.endswith('d'):
-            days = int(m[:-1])
-        # hour
-        elif m.endswith('h'):
-            hours = int(m[:-1])
-        # minute
-        elif m.endswith('m'):
-            minutes = int(m[:-1])
-
-    return (years, weeks, days, hours, minutes, seconds)
+        return (int(match.group(1)) * HOUR_SECONDS) + \
+               (int(match.group(2)) * MINUTE_SECONDS) + int(match.group(3))
+
+    # walk the string once, accumulating digits until a unit is found
+    total = 0
+    count = 0
+    for char in uptime_str:
+        if '0' <= char <= '9':
+            count = count * 10 + ord(char) - 48
+        else:
+            total += count * _UPTIME_UNITS.get(char, 0)
+            count = 0
+
+    return total
 
 
 def parse_uptime(uptime_str, short=False):
@@ -79,56 +118,30 @@ def parse_uptime(uptime_str, short=False):
     #
     # Return the uptime in seconds as an integer.
 
-    # Initialize to zero
-    (years, weeks, days, hours, minutes, seconds) = (0,) * 6
-
     uptime_str = uptime_str.strip()
 
-    if short:
-        (years, weeks, days, hours, minutes, seconds) = _parse_uptime_short(uptime_str)
-    else:
+    if not short:
         # in longer format, uptime is expressed in form of
         # 32 week(s), 6 day(s), 10 hour(s), 39 minute(s)
-        time_list = uptime_str.split(', ')
-        for element in time_list:
-            if re.search(r"year", element):
-                years = int(element.split()[0])
-            elif re.search(r"w(ee)?k", element):
-                weeks = int(element.split()[0])
-            elif re.search(r"day", element):
-                days = int(element.split()[0])
-            elif re.search(r"h(ou)?r", element):
-                hours = int(element.split()[0])
-            elif re.search(r"min(ute)?", element):
-                minutes = int(element.split()[0])
-
-    return (years * YEAR_SECONDS) + (weeks * WEEK_SECONDS) + \
-           (days * DAY_SECONDS) + (hours * HOUR_SECONDS) + \
-           (minutes * MINUTE_SECONDS) + seconds
+        # so the first letter of each unit is enough to tell them apart
+        return sum(int(m.group(1)) * _UPTIME_UNITS[m.group(2)]
+                   for m in _RE_UPTIME_LONG.finditer(uptime_str))
+
+    return _parse_uptime_short(uptime_str)
 
 
 def transform_lldp_capab(capabilities):
     """Transform FTOS LLDP capabilities into Napalm generic capabilities."""
-    modes = [
-        ['Repeater', 'repeater'],
-        ['Bridge', 'bridge'],
-        ['WLAN Access Point', 'wlan-access-point'],
-        ['Router', 'router'],
-        ['Telephone', 'telephone'],
-        ['Docsis', 'docsis-cable-device'],
-        ['Station only', 'station'],
-        ['Other', 'other']
-    ]
-
     capab = []
 
     # go over each mode and see if it's present
     while len(capabilities):
         found = False
-        for mode in modes:
-            if re.search('^%s' % mode[0], capabilities, re.IGNORECASE):
-                capab.append(mode[1])
-                capabilities = re.sub(r'^%s\s*' % mode[0], '', capabilities, re.IGNORECASE)
+        for ptr, mode in _LLDP_CAPAB_MODES:
+            m = ptr.search(capabilities)
+            if m:
+                capab.append(mode)
+                capabilities = capabilities[m.end():]
                 found = True
 
         if not found:
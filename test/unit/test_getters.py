@@ -1,10 +1,12 @@
 """Tests for getters."""
 
+import mock
 import pytest
 
 from napalm.base.test.getters import BaseTestGetters
 from napalm.base.test.getters import wrap_test_cases
 
+from napalm_ftos import ftos
 from napalm_ftos.utils import (
     canonical_interface_name,
     parse_uptime,
@@ -39,11 +41,13 @@ class TestGetter(BaseTestGetters):
         tests = [
             ['32w4d3h', 19710000, True],
             ['1w13d3h', 1738800, True],
+            ['1y2w', 32745600, True],
             ['04:12:34', 15154, True],
             ['12:34:56', 45296, True],
             ['32 wk, 4 day, 3 hr, 4 min', 19710240, False],
             ['32 wk, 4 day, 3 hr, 4 min', 19710240, False],
             ['32 week(s), 4 day(s), 3 hour(s), 4 minute(s)', 19710240, False],
+            ['1 year(s), 2 week(s), 3 day(s)', 33004800, False],
         ]
 
         for t in tests:
@@ -95,6 +99,48 @@ class TestGetter(BaseTestGetters):
 
         return get_config
 
+    @wrap_test_cases
+    def test_get_interfaces_counters_crlf(self, test_case):
+        """Test get_interfaces_counters on output with \\r\\n line endings."""
+        send_command = self.device.device.send_command
+
+        def crlf_send_command(command, **kwargs):
+            return send_command(command, **kwargs).replace(u'\n', u'\r\n')
+
+        with mock.patch.object(self.device.device, 'send_command', crlf_send_command):
+            return self.device.get_interfaces_counters()
+
+    @wrap_test_cases
+    def test_interfaces_output_is_shared(self, test_case):
+        """Test show interfaces output is shared between getters within the ttl."""
+        self.device.interfaces_cache_ttl = 2
+        self.device._invalidate_cache()
+        send_command = mock.Mock(wraps=self.device.device.send_command)
+
+        try:
+            with mock.patch.object(self.device.device, 'send_command', send_command), \
+                    mock.patch.object(ftos, '_now', return_value=1000.0) as now:
+                interfaces = self.device.get_interfaces()
+                now.return_value = 1001.0
+                counters = self.device.get_interfaces_counters()
+                assert sorted(interfaces) == sorted(counters)
+                assert send_command.call_count == 1
+
+                # once the ttl has expired, the output is fetched again
+                now.return_value = 1003.0
+                counters = self.device.get_interfaces_counters()
+                assert send_command.call_count == 2
+
+                # neither does a clock that was set back
+                now.return_value = 900.0
+                counters = self.device.get_interfaces_counters()
+                assert send_command.call_count == 3
+        finally:
+            self.device.interfaces_cache_ttl = ftos._INTERFACES_CACHE_TTL
+            self.device._invalidate_cache()
+
+        return counters
+
     @wrap_test_cases
     def test_is_alive(self, test_case):
         """There is little to test with this function."""